@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import inspect
+from types import CoroutineType
 from typing import Any, Callable, List, Tuple
 
 from jinja2 import nodes
-from jinja2.async_utils import async_variant
 from jinja2.ext import Extension
+from jinja2.nativetypes import NativeEnvironment
 from jinja2.parser import Parser
 
 __all__ = ['TryCatchExtension']
 
+_END_TOKENS_TRY = ('name:endtry', 'name:catch')
+_END_TOKENS_CATCH = ('name:endtry',)
+
 
 class TryCatchExtension(Extension):
     """Jinja2 try/catch extension.
@@ -34,77 +38,178 @@ class TryCatchExtension(Extension):
     """
     tags = {'try'}
 
+    #: Whether {% try %} blocks without a {% catch %} render None, rather than an
+    #: empty string, when an exception is raised within a NativeEnvironment.
+    return_none_on_no_catch = False
+
+    #: Name of the caller macro parameter receiving the caught exception.
+    #: NOTE: Jinja can lex any Python identifier, so this name is reachable from within
+    #:       the {% try %} and {% catch %} bodies (though not after {% endtry %}).
+    _CAUGHT_EXCEPTION_PARAM = '_try_catch_exception'
+
     def parse(self, parser: Parser):
-        lineno = next(parser.stream).lineno
+        stream = parser.stream
+        lineno = next(stream).lineno
+
+        try_body = self._parse_body(parser, _END_TOKENS_TRY)
+
+        catch_body = None
+        if stream.skip_if('name:catch'):
+            catch_body = self._parse_body(parser, _END_TOKENS_CATCH)
+
+        stream.expect('name:endtry')
 
-        out_nodes: List[nodes.Node] = []
         try_catch_args: List[nodes.Expr] = []
 
-        try_body = self._parse_statements_or_empty(parser, ('name:endtry', 'name:catch'))
-
-        if parser.stream.skip_if('name:catch'):
-            catch_body = self._parse_statements_or_empty(parser, ('name:endtry',))
-
-            # If we have a catch block, we define a macro function that can be called
-            # if an exception is raised.
-            catch_macro = nodes.Macro(
-                '_on_catch',
-                [nodes.Name('exception', 'param')],
-                [],
-                catch_body,
-            )
-            out_nodes.append(catch_macro)
-            try_catch_args.append(nodes.Name(catch_macro.name, 'load'))
-
-        parser.stream.expect('name:endtry')
-
-        body = [
-            *out_nodes,
-            nodes.CallBlock(
-                self.call_method('_try_catch', try_catch_args, lineno=lineno),
-                [],
-                [],
-                try_body,
-            ),
-        ]
-
-        # Encase everything in an artificial scoping block, to avoid exposing
-        # the catch macro after the {% endtry %} block.
-        return nodes.Scope(body, lineno=lineno)
-
-    def _sync_try_catch(
-        self, catch_body: Callable[[Exception], Any] | None = None, *, caller: Callable
-    ):
+        # Bodies consisting solely of literal template data cannot raise, so they can
+        # be output directly, without any exception handling (nor the catch body,
+        # which can never be rendered — unless it defines blocks, which are hoisted
+        # into the template regardless of where they appear).
+        if self._is_nothrow(try_body) and not self._defines_blocks(catch_body):
+            if not self._is_native_environment():
+                return try_body
+
+            # NOTE: in native environments, the caller macro's result is natively
+            #       concatenated again by the template, so we must keep rendering the
+            #       body through it for literals (e.g. '1') to render the same.
+            try_catch_method = '_try_catch_nothrow'
+            caller_args, caller_defaults, caller_body = [], [], try_body
+
+        elif catch_body is None:
+            try_catch_method = self._select_try_catch_method('try_catch')
+            caller_args, caller_defaults, caller_body = [], [], try_body
+
+            if self.return_none_on_no_catch and self._is_native_environment():
+                try_catch_args.append(nodes.Const(None, lineno=lineno))
+
+        else:
+            # If we have a catch block, both bodies are rendered by the same caller
+            # macro: it's first called without arguments to render the try body, and
+            # if that raises, it's called again with the exception to render the
+            # catch body. This avoids defining (and dispatching to) a catch macro.
+            try_catch_method = self._select_try_catch_method('try_catch_with_handler')
+            caller_args = [nodes.Name(self._CAUGHT_EXCEPTION_PARAM, 'param', lineno=lineno)]
+            caller_defaults = [nodes.Const(None, lineno=lineno)]
+
+            caught_exception = nodes.Name(self._CAUGHT_EXCEPTION_PARAM, 'load', lineno=lineno)
+            caller_body = [
+                nodes.If(
+                    nodes.Test(caught_exception, 'none', [], [], None, None, lineno=lineno),
+                    try_body,
+                    [],
+                    [
+                        nodes.Assign(
+                            nodes.Name('exception', 'store', lineno=lineno),
+                            caught_exception,
+                            lineno=lineno,
+                        ),
+                        *catch_body,
+                    ],
+                    lineno=lineno,
+                ),
+            ]
+
+        # NOTE: no artificial scoping block is necessary, as both bodies are rendered
+        #       within the caller macro, so any names they set do not leak out.
+        return nodes.CallBlock(
+            self.call_method(try_catch_method, try_catch_args, lineno=lineno),
+            caller_args,
+            caller_defaults,
+            caller_body,
+            lineno=lineno,
+        )
+
+    def _select_try_catch_method(self, name: str) -> str:
+        """Return the name of the sync or async variant of a try/catch helper
+
+        Whether templates are compiled for async rendering is fixed by the environment,
+        so we resolve the variant once here, rather than with @async_variant on every
+        render (which also necessitates binding the helpers to the extension instance).
+        """
+        if self.environment.is_async:
+            return f'_async_{name}'
+        else:
+            return f'_sync_{name}'
+
+    @staticmethod
+    def _sync_try_catch(default: Any = '', *, caller: Callable):
+        try:
+            return caller()
+        except Exception:
+            return default
+
+    @staticmethod
+    async def _async_try_catch(default: Any = '', *, caller: Callable):
+        # NOTE: macros (such as caller) return coroutines in async environments,
+        #       so we check for those before falling back to the much slower
+        #       Awaitable ABC check performed by inspect.isawaitable().
+        try:
+            res = caller()
+            if isinstance(res, CoroutineType) or inspect.isawaitable(res):
+                res = await res
+            return res
+        except Exception:
+            return default
+
+    @staticmethod
+    def _sync_try_catch_with_handler(*, caller: Callable):
         try:
             return caller()
         except Exception as exception:
-            if catch_body:
-                return catch_body(exception)
-            else:
-                return ''
-
-    @async_variant(_sync_try_catch)
-    async def _try_catch(
-        self, catch_body: Callable[[Exception], Any] | None = None, *, caller: Callable
-    ):
+            return caller(exception)
+
+    @staticmethod
+    async def _async_try_catch_with_handler(*, caller: Callable):
         try:
             res = caller()
-            if inspect.isawaitable(res):
+            if isinstance(res, CoroutineType) or inspect.isawaitable(res):
                 res = await res
             return res
         except Exception as exception:
-            if catch_body:
-                catch_res = catch_body(exception)
-                if inspect.isawaitable(catch_res):
-                    catch_res = await catch_res
-                return catch_res
-            else:
-                return ''
-
-    def _parse_statements_or_empty(
-        self, parser: Parser, end_tokens: Tuple[str, ...]
-    ) -> List[nodes.Node]:
+            catch_res = caller(exception)
+            if isinstance(catch_res, CoroutineType) or inspect.isawaitable(catch_res):
+                catch_res = await catch_res
+            return catch_res
+
+    @staticmethod
+    def _try_catch_nothrow(*, caller: Callable):
+        # NOTE: in async environments, caller() returns a coroutine, which Jinja's
+        #       generated code awaits for us.
+        return caller()
+
+    def _is_native_environment(self) -> bool:
+        """Whether templates are compiled for a NativeEnvironment"""
+        return isinstance(self.environment, NativeEnvironment)
+
+    @staticmethod
+    def _is_nothrow(body: List[nodes.Node]) -> bool:
+        """Whether the statements can be statically proven not to raise when rendered"""
+        return all(
+            isinstance(node, nodes.Output)
+            and all(isinstance(child, nodes.TemplateData) for child in node.nodes)
+            for node in body
+        )
+
+    @staticmethod
+    def _defines_blocks(body: List[nodes.Node] | None) -> bool:
+        """Whether the statements contain any {% block %} definitions"""
+        return body is not None and any(
+            isinstance(node, nodes.Block) or node.find(nodes.Block) is not None
+            for node in body
+        )
+
+    def _parse_body(self, parser: Parser, end_tokens: Tuple[str, ...]) -> List[nodes.Node]:
+        """Parse the statements of a {% try %} or {% catch %} body
+
+        Empty bodies are returned as an empty list, except within a NativeEnvironment,
+        where they're padded with an explicit empty string output.
+        """
+        lineno = parser.stream.current.lineno
         stmts = parser.parse_statements(end_tokens=end_tokens)
-        if not stmts:
-            stmts = [nodes.Output([nodes.TemplateData('')])]
+
+        # NOTE: macros without any output render to None in native environments, so
+        #       we emit an explicit empty string for them. Elsewhere, concatenating
+        #       no output already produces an empty string, and we can skip the write.
+        if not stmts and self._is_native_environment():
+            stmts = [nodes.Output([nodes.TemplateData('', lineno=lineno)], lineno=lineno)]
         return stmts
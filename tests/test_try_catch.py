@@ -1,8 +1,10 @@
 from typing import Any, Callable, Dict, Type
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes
+import jinja2.nodes
 import pytest
 
 from jinja_try_catch.extension import TryCatchExtension
@@ -190,6 +192,19 @@ TEST_CASES = {
         "catch: 'i_do_not_exist_and_throw_an_error' is undefined",
     ),
 
+    'try-catch_block-no_error': (
+        # language=jinja2
+        '''
+        {%- try -%}
+            try
+        {%- catch -%}
+            {%- block b -%}catch{%- endblock -%}
+        {%- endtry -%}
+        |{{- self.b() -}}
+        '''.strip(),
+        'try|catch',
+    ),
+
     '_on_catch-scoping-after': (
         # language=jinja2
         '''
@@ -201,27 +216,97 @@ TEST_CASES = {
         False,
     ),
 
-    # TODO: use inaccessible name to avoid exposing catch handler
-    # '_on_catch-scoping-inside_try': (
-    #     # language=jinja2
-    #     '''
-    #     {%- try -%}
-    #       {{- _on_catch is defined -}}
-    #     {%- catch -%}
-    #     {%- endtry -%}
-    #     '''.strip(),
-    #     False,
-    # ),
-    # '_on_catch-scoping-inside_catch': (
-    #     # language=jinja2
-    #     '''
-    #     {%- try -%}
-    #     {%- catch -%}
-    #       {{- _on_catch is defined -}}
-    #     {%- endtry -%}
-    #     '''.strip(),
-    #     False,
-    # ),
+    # NOTE: the caught exception is passed to the caller macro through a parameter,
+    #       which, like any macro parameter, is visible within both bodies.
+    '_try_catch_exception-scoping-inside_try': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {{- _try_catch_exception is none -}}
+        {%- catch -%}
+        {%- endtry -%}
+        '''.strip(),
+        True,
+    ),
+    '_try_catch_exception-scoping-inside_catch': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {{- i_do_not_exist_and_throw_an_error -}}
+          try
+        {%- catch -%}
+          {{- _try_catch_exception is sameas exception -}}
+        {%- endtry -%}
+        '''.strip(),
+        True,
+    ),
+    '_try_catch_exception-scoping-after': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {{- i_do_not_exist_and_throw_an_error -}}
+          try
+        {%- catch -%}
+        {%- endtry -%}
+        {{- _try_catch_exception is defined -}}
+        '''.strip(),
+        False,
+    ),
+    'exception-scoping-inside_try': (
+        # language=jinja2
+        '''
+        {%- set exception = 'outer' -%}
+        {%- try -%}
+          {{- exception -}}
+        {%- catch -%}
+          catch
+        {%- endtry -%}
+        '''.strip(),
+        'outer',
+    ),
+    'exception-scoping-after': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {{- i_do_not_exist_and_throw_an_error -}}
+          try
+        {%- catch -%}
+        {%- endtry -%}
+        {{- exception is defined -}}
+        '''.strip(),
+        False,
+    ),
+    'set-scoping-after': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {%- set l = [] -%}
+          try
+        {%- catch -%}
+          {%- set c = [] -%}
+        {%- endtry -%}
+        {{- l is defined or c is defined -}}
+        '''.strip(),
+        'tryFalse',
+    ),
+
+    'nested-error': (
+        # language=jinja2
+        '''
+        {%- try -%}
+          {%- try -%}
+            {{- i_do_not_exist_and_throw_an_error -}}
+            try
+          {%- catch -%}
+            {{- i_also_do_not_exist -}}
+            catch
+          {%- endtry -%}
+        {%- catch -%}
+          outer: {{ exception -}}
+        {%- endtry -%}
+        '''.strip(),
+        "outer: 'i_also_do_not_exist' is undefined",
+    ),
 }
 
 
@@ -242,3 +327,111 @@ async def test_async_try_catch(async_env, preprocess_expected, source, expected)
     actual = await template.render_async()
     expected = preprocess_expected(expected)
     assert expected == actual
+
+
+LITERAL_TRY_SOURCE = (
+    # language=jinja2
+    '''
+    {%- try -%}
+        '1'
+    {%- catch -%}
+        catch
+    {%- endtry -%}
+    '''.strip()
+)
+
+
+def test_literal_try_elided(sync_env, is_native_env):
+    call_blocks = list(sync_env.parse(LITERAL_TRY_SOURCE).find_all(jinja2.nodes.CallBlock))
+
+    # Native environments still render literal bodies through the caller macro,
+    # but without any exception handling.
+    if is_native_env:
+        assert len(call_blocks) == 1
+        assert call_blocks[0].call.node.name == '_try_catch_nothrow'
+    else:
+        assert call_blocks == []
+
+
+def test_sync_literal_try(sync_env, is_native_env):
+    template = sync_env.from_string(LITERAL_TRY_SOURCE)
+
+    actual = template.render()
+    expected = 1 if is_native_env else "'1'"
+    assert expected == actual
+
+
+@pytest.mark.asyncio
+async def test_async_literal_try(async_env, is_native_env):
+    template = async_env.from_string(LITERAL_TRY_SOURCE)
+
+    actual = await template.render_async()
+    expected = 1 if is_native_env else "'1'"
+    assert expected == actual
+
+
+@pytest.fixture(params=[
+    pytest.param(False, id='return_empty'),
+    pytest.param(True, id='return_none'),
+])
+def return_none_on_no_catch(request, env_kwargs) -> bool:
+    class CustomTryCatchExtension(TryCatchExtension):
+        return_none_on_no_catch = request.param
+
+    env_kwargs['extensions'] = [CustomTryCatchExtension]
+    return request.param
+
+
+def test_sync_return_none_on_no_catch(
+    return_none_on_no_catch, is_native_env, sync_env
+):
+    template = sync_env.from_string(TEST_CASES['try-no_catch-error'][0])
+
+    actual = template.render()
+    expected = None if return_none_on_no_catch and is_native_env else ''
+    assert expected == actual
+
+
+@pytest.mark.asyncio
+async def test_async_return_none_on_no_catch(
+    return_none_on_no_catch, is_native_env, async_env
+):
+    template = async_env.from_string(TEST_CASES['try-no_catch-error'][0])
+
+    actual = await template.render_async()
+    expected = None if return_none_on_no_catch and is_native_env else ''
+    assert expected == actual
+
+
+class MemoryBytecodeCache(jinja2.BytecodeCache):
+    def __init__(self):
+        self.cache: Dict[str, bytes] = {}
+        self.hits = 0
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        if bucket.key in self.cache:
+            bucket.bytecode_from_string(self.cache[bucket.key])
+            self.hits += 1
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        self.cache[bucket.key] = bucket.bytecode_to_string()
+
+
+@pytest.mark.parametrize(('source', 'expected'), TEST_CASES.values(), ids=TEST_CASES.keys())
+def test_bytecode_cache(env_kwargs, env_class, preprocess_expected, source, expected):
+    bytecode_cache = MemoryBytecodeCache()
+
+    def render_with_new_env():
+        env = env_class(
+            **env_kwargs,
+            loader=jinja2.DictLoader({'template': source}),
+            bytecode_cache=bytecode_cache,
+        )
+        return env.get_template('template').render()
+
+    render_with_new_env()
+    actual = render_with_new_env()
+
+    assert bytecode_cache.hits == 1
+    expected = preprocess_expected(expected)
+    assert expected == actual